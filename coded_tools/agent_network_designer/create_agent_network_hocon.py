@@ -7,11 +7,12 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
-from copy import deepcopy
+import asyncio
 import logging
+import os
+import threading
 from typing import Any
 
-import aiofiles  # Import for asynchronous file operations
 from neuro_san.interfaces.coded_tool import CodedTool
 
 from coded_tools.agent_network_validator import AgentNetworkValidator
@@ -50,71 +51,163 @@ HOCON_HEADER_REMAINDER = (
     'are actually grounded in real data or you are operating a real application API or microservice."\n'
     '"tools": [\n'
 )
-TOP_AGENT_TEMPLATE = (
-    "        {\n"
-    '            "name": "%s",\n'
-    '            "function": {\n'
-    '                "description": """\n'
-    "An assistant that answer inquiries from the user.\n"
-    '                """\n'
-    "            },\n"
-    '            "instructions": ${instructions_prefix} """\n'
-    "%s\n"
-    '""" ${aaosa_instructions},\n'
-    '            "tools": [%s]\n'
-    "        },\n"
-)
-REGULAR_AGENT_TEMPLATE = (
-    "        {\n"
-    '            "name": "%s",\n'
-    '            "function": ${aaosa_call},\n'
-    '            "instructions": ${instructions_prefix} """\n'
-    "%s\n"
-    '""" ${aaosa_instructions},\n'
-    '            "command": ${aaosa_command},\n'
-    '            "tools": [%s]\n'
-    "        },\n"
-)
-LEAF_NODE_AGENT_TEMPLATE = (
-    "        {\n"
-    '            "name": "%s",\n'
-    '            "function": ${aaosa_call},\n'
-    '            "instructions": ${instructions_prefix} ${demo_mode} """\n'
-    "%s\n"
-    '""",\n'
-    "        },\n"
-)
+
+# Last seen manifest content and the (modification time, size) it was read at.
+_MANIFEST_CACHE: dict[str, Any] = {"path": None, "stat": None, "content": None}
+_MANIFEST_LOCK = threading.Lock()
+
+LOGGER = logging.getLogger(__name__)
+
+
+# The per-agent templates are f-string functions so they are compiled once at module load
+# rather than re-parsed by %-formatting for every agent.
+def format_top_agent(agent_name: str, instructions: str, tools: str) -> str:
+    """
+    :param agent_name: Name of the top agent
+    :param instructions: The agent's own instructions
+    :param tools: Comma-separated, quoted names of the down-chain agents
+
+    :return: The HOCON section for the top agent
+    """
+    return (
+        "        {\n"
+        f'            "name": "{agent_name}",\n'
+        '            "function": {\n'
+        '                "description": """\n'
+        "An assistant that answer inquiries from the user.\n"
+        '                """\n'
+        "            },\n"
+        '            "instructions": ${instructions_prefix} """\n'
+        f"{instructions}\n"
+        '""" ${aaosa_instructions},\n'
+        f'            "tools": [{tools}]\n'
+        "        },\n"
+    )
+
+
+def format_regular_agent(agent_name: str, instructions: str, tools: str) -> str:
+    """
+    :param agent_name: Name of the agent
+    :param instructions: The agent's own instructions
+    :param tools: Comma-separated, quoted names of the down-chain agents
+
+    :return: The HOCON section for an agent with down chains
+    """
+    return (
+        "        {\n"
+        f'            "name": "{agent_name}",\n'
+        '            "function": ${aaosa_call},\n'
+        '            "instructions": ${instructions_prefix} """\n'
+        f"{instructions}\n"
+        '""" ${aaosa_instructions},\n'
+        '            "command": ${aaosa_command},\n'
+        f'            "tools": [{tools}]\n'
+        "        },\n"
+    )
+
+
+def format_leaf_node_agent(agent_name: str, instructions: str, _tools: str = "") -> str:
+    """
+    :param agent_name: Name of the agent
+    :param instructions: The agent's own instructions
+    :param _tools: Unused, leaf node agents have no down chains
+
+    :return: The HOCON section for a leaf node agent
+    """
+    return (
+        "        {\n"
+        f'            "name": "{agent_name}",\n'
+        '            "function": ${aaosa_call},\n'
+        '            "instructions": ${instructions_prefix} ${demo_mode} """\n'
+        f"{instructions}\n"
+        '""",\n'
+        "        },\n"
+    )
+
+
+# Formatters for every agent other than the top agent, keyed by whether the agent has down chains
+AGENT_FORMATTERS = {
+    True: format_regular_agent,
+    False: format_leaf_node_agent,
+}
+
+
+def write_agent_network_file(file_path: str, the_agent_network_hocon_str: str):
+    """
+    Writes the agent network hocon string to a file.
+    The string is already complete in memory, so it is written straight to the file descriptor
+    without going through a buffered text file.
+    :param file_path: Path of the agent network hocon file
+    :param the_agent_network_hocon_str: The agent network hocon string
+    """
+    data = memoryview(the_agent_network_hocon_str.encode("utf-8"))
+    fd: int = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write() may write less than asked for, so keep going until everything is written
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def _stat_manifest(manifest_path: str) -> tuple[int, int]:
+    """
+    :param manifest_path: Path of the manifest.hocon file
+    :return: The modification time in nanoseconds and the size of the manifest file
+    """
+    stat_result = os.stat(manifest_path)
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def update_manifest(manifest_path: str, the_agent_network_name: str):
+    """
+    Adds an entry for the agent network to the manifest file if it is not already there.
+
+    The manifest content is cached against its modification time, so it is only re-read
+    when something else changed it, and a new entry is written in place from the closing
+    brace onwards instead of rewriting the whole file.
+    :param manifest_path: Path of the manifest.hocon file
+    :param the_agent_network_name: The file name, without the .hocon extension
+    """
+    entry_key: bytes = f'"{the_agent_network_name}.hocon"'.encode("utf-8")
+    manifest_entry: bytes = b"    " + entry_key + b": true,"
+    with _MANIFEST_LOCK:
+        # Read the current manifest content, unless the cached copy is still current
+        stat: tuple[int, int] = _stat_manifest(manifest_path)
+        if _MANIFEST_CACHE["path"] == manifest_path and _MANIFEST_CACHE["stat"] == stat:
+            manifest_content: bytes = _MANIFEST_CACHE["content"]
+        else:
+            with open(manifest_path, "rb") as file:
+                manifest_content = file.read()
+        # Find the position to insert the new entry (before the closing brace)
+        insert_position = manifest_content.rfind(b"}")
+        # Check if the entry already exists to avoid duplicates
+        if insert_position != -1 and entry_key not in manifest_content:
+            # Write only the new entry followed by the original tail of the file
+            tail: bytes = b"\n" + manifest_entry + manifest_content[insert_position:]
+            with open(manifest_path, "r+b") as file:
+                file.seek(insert_position)
+                file.write(tail)
+                file.truncate()
+            manifest_content = manifest_content[:insert_position] + tail
+            stat = _stat_manifest(manifest_path)
+        _MANIFEST_CACHE.update(path=manifest_path, stat=stat, content=manifest_content)
 
 
 async def modify_registry(the_agent_network_hocon_str, the_agent_network_name):
     """
     Writes the agent network to a file and updates the manifest.hocon file.
+    Both are done with plain synchronous I/O in a worker thread. The manifest is only updated
+    once the network file has been written, so it never registers a file that does not exist.
     :param the_agent_network_hocon_str: The agent network hocon string
     :param the_agent_network_name: The file name, without the .hocon extension
     """
-    # Write the agent network file
     file_path = OUTPUT_PATH + the_agent_network_name + ".hocon"
-    async with aiofiles.open(file_path, "w") as file:
-        await file.write(the_agent_network_hocon_str)
-    # Update the manifest.hocon file
     manifest_path = OUTPUT_PATH + "manifest.hocon"
-    manifest_entry = f'    "{the_agent_network_name}.hocon": true,'
-    # Read the current manifest content
-    async with aiofiles.open(manifest_path, "r") as file:
-        manifest_content = await file.read()
-    # Find the position to insert the new entry (before the closing brace)
-    insert_position = manifest_content.rfind("}")
-    if insert_position != -1:
-        # Check if the entry already exists to avoid duplicates
-        if f'"{the_agent_network_name}.hocon"' not in manifest_content:
-            # Insert the new entry
-            updated_content = (
-                manifest_content[:insert_position] + "\n" + manifest_entry + manifest_content[insert_position:]
-            )
-
-            # Write the updated content back to the manifest file
-            async with aiofiles.open(manifest_path, "w") as file:
-                await file.write(updated_content)
+    # Write the agent network file
+    await asyncio.to_thread(write_agent_network_file, file_path, the_agent_network_hocon_str)
+    # Update the manifest.hocon file
+    await asyncio.to_thread(update_manifest, manifest_path, the_agent_network_name)
 
 
 class CreateAgentNetworkHocon(CodedTool):
@@ -157,17 +250,16 @@ class CreateAgentNetworkHocon(CodedTool):
                 a text string an error message in the format:
                 "Error: <error message>"
         """
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = LOGGER
 
-        # Use copy here since we may have to rearrange the dictionary to get the correct frontman
-        network_def: dict[str, Any] = deepcopy(sly_data.get(AGENT_NETWORK_DEFINITION))
+        # No copy is needed: generating the HOCON only reads the agent network definition.
+        network_def: dict[str, Any] = sly_data.get(AGENT_NETWORK_DEFINITION)
         if not network_def:
             return "Error: No network in sly data!"
 
         # Validate the agent network and return error message if there are any issues.
         validator = AgentNetworkValidator(network_def)
-        error_list: list[str] = validator.validate_network_structure() + \
-            validator.validate_network_keywords("instructions")
+        error_list: list[str] = validator.validate_network(("instructions",))
         if error_list:
             error_msg = f"Error: {error_list}"
             logger.error(error_msg)
@@ -180,11 +272,13 @@ class CreateAgentNetworkHocon(CodedTool):
         sly_data["agent_network_name"] = the_agent_network_name
 
         logger.info(">>>>>>>>>>>>>>>>>>>Create Agent Network Hocon>>>>>>>>>>>>>>>>>>")
-        logger.info("Agent Network Name: %s", str(the_agent_network_name))
+        logger.info("Agent Network Name: %s", the_agent_network_name)
 
         the_agent_network_hocon_str: str = self.get_agent_network_hocon(validator, the_agent_network_name)
 
-        logger.info("The resulting agent network HOCON: \n %s", str(the_agent_network_hocon_str))
+        # The full HOCON can be large, so only its size is logged at INFO
+        logger.info("The resulting agent network HOCON has %d characters", len(the_agent_network_hocon_str))
+        logger.debug("The resulting agent network HOCON: \n %s", the_agent_network_hocon_str)
         if WRITE_TO_FILE:
             await modify_registry(the_agent_network_hocon_str, the_agent_network_name)
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
@@ -205,39 +299,39 @@ class CreateAgentNetworkHocon(CodedTool):
         # Make sure that the top agent is the first agent.
         # Find or set the top agent
         top_agent_name: str = validator.get_top_agent()
-        # Move top agent to front
-        if top_agent_name != next(iter(network_def)):
-            top_agent: dict[str, Any] = network_def.pop(top_agent_name)
-            network_def = {top_agent_name: top_agent, **network_def}
 
-        agent_network_hocon: str = HOCON_HEADER_START + agent_network_name + HOCON_HEADER_REMAINDER
+        # Collect the pieces in a list and join once at the end instead of growing a string.
+        hocon_parts: list[str] = [HOCON_HEADER_START, agent_network_name, HOCON_HEADER_REMAINDER]
+        hocon_parts.append(
+            format_top_agent(
+                top_agent_name,
+                network_def[top_agent_name]["instructions"],
+                self.get_tools(validator, top_agent_name),
+            )
+        )
 
+        # The remaining agents keep their order and are formatted according to whether they have down chains
         for agent_name, agent in network_def.items():
-            tools = ""
-            if agent.get("down_chains"):
-                for j, down_chain in enumerate(agent["down_chains"]):
-                    tools = tools + '"' + down_chain + '"'
-                    if j < len(agent["down_chains"]) - 1:
-                        tools = tools + ","
-
-            if agent_name == top_agent_name:  # top agent
-                an_agent = TOP_AGENT_TEMPLATE % (
-                    agent_name,
-                    agent["instructions"],
-                    tools,
-                )
-            elif agent.get("down_chains"):
-                an_agent = REGULAR_AGENT_TEMPLATE % (
-                    agent_name,
-                    agent["instructions"],
-                    tools,
-                )
-            else:  # leaf node agent
-                an_agent = LEAF_NODE_AGENT_TEMPLATE % (
-                    agent_name,
-                    agent["instructions"],
-                )
-            agent_network_hocon += an_agent
-
-        agent_network_hocon += "]\n}\n"
-        return agent_network_hocon
+            if agent_name == top_agent_name:
+                continue
+            tools: str = self.get_tools(validator, agent_name)
+            format_agent = AGENT_FORMATTERS[bool(tools)]
+            hocon_parts.append(format_agent(agent_name, agent["instructions"], tools))
+
+        hocon_parts.append("]\n}\n")
+        return "".join(hocon_parts)
+
+    @staticmethod
+    def get_tools(validator: AgentNetworkValidator, agent_name: str) -> str:
+        """
+        :param validator: Agent network validator.
+        :param agent_name: Name of the agent
+
+        :return: The comma-separated, quoted names of the agent's down chains for its HOCON "tools" list
+        """
+        # Use the tools string prepared during validation when there is one
+        tools: str = validator.quoted_down_chains.get(agent_name)
+        if tools is None:
+            down_chains: list[str] = validator.network[agent_name].get("down_chains") or ()
+            tools = ",".join(f'"{down_chain}"' for down_chain in down_chains)
+        return tools
@@ -7,7 +7,6 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
-import asyncio
 import logging
 from typing import Any
 
@@ -15,6 +14,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 AGENT_NETWORK_DEFINITION = "agent_network_definition"
 
+LOGGER = logging.getLogger(__name__)
+
 
 class AddAgent(CodedTool):
     """
@@ -55,23 +56,98 @@ class AddAgent(CodedTool):
                 a text string of an error message in the format:
                 "Error: <error message>"
         """
-        network_def: dict[str, Any] = sly_data.get(AGENT_NETWORK_DEFINITION)
-        if not network_def:
-            network_def = {}
-
         the_agent_name: str = args.get("agent_name", "")
         if the_agent_name == "":
             return "Error: No agent_name provided."
 
-        logger = logging.getLogger(self.__class__.__name__)
-        logger.info(">>>>>>>>>>>>>>>>>>>Add Agent>>>>>>>>>>>>>>>>>>")
-        logger.info("Agent Name: %s", str(the_agent_name))
-        network_def[the_agent_name] = {}
-        logger.info("The resulting agent network definition: \n %s", str(network_def))
-        sly_data[AGENT_NETWORK_DEFINITION] = network_def
-        logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
-        return network_def
+        return add_agents_to_network([the_agent_name], sly_data, replace_existing=True)
 
     async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any] | str:
-        """Run invoke asynchronously."""
-        return await asyncio.to_thread(self.invoke, args, sly_data)
+        """Run invoke directly."""
+        return self.invoke(args, sly_data)
+
+
+class AddAgents(CodedTool):
+    """
+    CodedTool implementation which adds several agents to the agent network definition in the sly data
+    in a single call.
+
+    Agent network definition is a structured representation of an agent network, expressed as a dictionary.
+    Each key is an agent name, and its value is an object containing:
+    - an instructions to the agent
+    - a list of down-chain agents (agents reporting to it)
+    """
+
+    def invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any] | str:
+        """
+        :param args: An argument dictionary whose keys are the parameters
+                to the coded tool and whose values are the values passed for them
+                by the calling agent.  This dictionary is to be treated as read-only.
+
+                The argument dictionary expects the following keys:
+                    "agent_names": list of the names of the agents to add.
+
+        :param sly_data: A dictionary whose keys are defined by the agent hierarchy,
+                but whose values are meant to be kept out of the chat stream.
+
+                This dictionary is largely to be treated as read-only.
+                It is possible to add key/value pairs to this dict that do not
+                yet exist as a bulletin board, as long as the responsibility
+                for which coded_tool publishes new entries is well understood
+                by the agent chain implementation and the coded_tool implementation
+                adding the data is not invoke()-ed more than once.
+
+                Keys expected for this implementation are:
+                    "agent_network_definition": an outline of an agent network
+
+        :return:
+            In case of successful execution:
+                the agent network definition as a dictionary.
+            otherwise:
+                a text string of an error message in the format:
+                "Error: <error message>"
+        """
+        agent_names: list[str] = args.get("agent_names")
+        if not agent_names:
+            return "Error: No agent_names provided."
+        if not isinstance(agent_names, list) or not all(
+            isinstance(agent_name, str) and agent_name for agent_name in agent_names
+        ):
+            return "Error: agent_names must be a list of non-empty agent names."
+
+        return add_agents_to_network(agent_names, sly_data)
+
+    async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any] | str:
+        """Run invoke directly."""
+        return self.invoke(args, sly_data)
+
+
+def add_agents_to_network(
+    agent_names: list[str], sly_data: dict[str, Any], replace_existing: bool = False
+) -> dict[str, Any]:
+    """
+    Adds the given agents, each with an empty definition, to the agent network definition in one pass.
+    :param agent_names: The names of the agents to add
+    :param sly_data: The sly data holding the agent network definition
+    :param replace_existing: Whether an agent that is already in the network is reset to an empty definition.
+            Otherwise, existing agents are left as they are.
+
+    :return: The resulting agent network definition
+    """
+    network_def: dict[str, Any] = sly_data.get(AGENT_NETWORK_DEFINITION)
+    if not network_def:
+        network_def = {}
+
+    LOGGER.info(">>>>>>>>>>>>>>>>>>>Add Agents>>>>>>>>>>>>>>>>>>")
+    LOGGER.info("Agent Names: %s", agent_names)
+    for agent_name in agent_names:
+        if replace_existing:
+            network_def[agent_name] = {}
+        else:
+            network_def.setdefault(agent_name, {})
+    LOGGER.info("Added %d agents", len(agent_names))
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("The resulting agent network definition: \n %s", network_def)
+    sly_data[AGENT_NETWORK_DEFINITION] = network_def
+    LOGGER.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
+    return network_def
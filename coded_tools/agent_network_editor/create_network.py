@@ -7,7 +7,6 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
-import asyncio
 import logging
 from typing import Any
 from typing import Dict
@@ -16,6 +15,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 AGENT_NETWORK_DEFINITION = "agent_network_definition"
 
+LOGGER = logging.getLogger(__name__)
+
 
 class CreateNetwork(CodedTool):
     """
@@ -64,16 +65,15 @@ class CreateNetwork(CodedTool):
         if not agent_names:
             return "Error: No agent_names provided."
 
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = LOGGER
         logger.info(">>>>>>>>>>>>>>>>>>>Create New Agent Netwrok Definiton>>>>>>>>>>>>>>>>>>")
-        for agent_name in agent_names:
-            logger.info(">>>>>>>>>>>>>>>>>>>Adding Agent>>>>>>>>>>>>>>>>>>")
-            logger.info("Agent Name: %s", agent_name)
-            sly_data[AGENT_NETWORK_DEFINITION][agent_name] = {}
-        logger.info("The resulting agent network definition: \n %s", str(sly_data[AGENT_NETWORK_DEFINITION]))
+        logger.info("Agent Names: %s", agent_names)
+        network_def: dict[str, Any] = {agent_name: {} for agent_name in agent_names}
+        sly_data[AGENT_NETWORK_DEFINITION] = network_def
+        logger.info("The resulting agent network definition: \n %s", network_def)
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
-        return sly_data[AGENT_NETWORK_DEFINITION]
+        return network_def
 
     async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any] | str:
-        """Run invoke asynchronously."""
-        return await asyncio.to_thread(self.invoke, args, sly_data)
+        """Run invoke directly."""
+        return self.invoke(args, sly_data)
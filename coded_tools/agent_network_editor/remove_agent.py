@@ -7,7 +7,6 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
-import asyncio
 import logging
 from typing import Any
 
@@ -15,6 +14,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 AGENT_NETWORK_DEFINITION = "agent_network_definition"
 
+LOGGER = logging.getLogger(__name__)
+
 
 class RemoveAgent(CodedTool):
     """
@@ -65,15 +66,15 @@ class RemoveAgent(CodedTool):
         if the_agent_name not in network_def:
             return "Error: agent_name not in the agent network"
 
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = LOGGER
         logger.info(">>>>>>>>>>>>>>>>>>>Remove Agent>>>>>>>>>>>>>>>>>>")
         logger.info("Agent Name: %s", the_agent_name)
         network_def.pop(the_agent_name, None)
-        logger.info("The resulting agent network definition: \n %s", str(network_def))
+        logger.info("The resulting agent network definition: \n %s", network_def)
         sly_data[AGENT_NETWORK_DEFINITION] = network_def
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return network_def
 
     async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any] | str:
-        """Run invoke asynchronously."""
-        return await asyncio.to_thread(self.invoke, args, sly_data)
+        """Run invoke directly."""
+        return self.invoke(args, sly_data)
@@ -7,7 +7,6 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
-import asyncio
 import logging
 from typing import Any
 
@@ -15,6 +14,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 AGENT_NETWORK_DEFINITION = "agent_network_definition"
 
+LOGGER = logging.getLogger(__name__)
+
 
 class UpdateAgent(CodedTool):
     """
@@ -71,16 +72,16 @@ class UpdateAgent(CodedTool):
         if new_down_chains is None:
             return "Error: No down chains list provided."
 
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = LOGGER
         logger.info(">>>>>>>>>>>>>>>>>>>Update Agent Network Definiton>>>>>>>>>>>>>>>>>>")
-        logger.info("Agent Name: %s", str(the_agent_name))
-        logger.info("Down Chain Agents: %s", str(new_down_chains))
+        logger.info("Agent Name: %s", the_agent_name)
+        logger.info("Down Chain Agents: %s", new_down_chains)
         network_def[the_agent_name]["down_chains"] = new_down_chains
-        logger.info("The resulting agent network definition: \n %s", str(network_def))
+        logger.info("The resulting agent network definition: \n %s", network_def)
         sly_data[AGENT_NETWORK_DEFINITION] = network_def
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return network_def
 
     async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any] | str:
-        """Run invoke asynchronously."""
-        return await asyncio.to_thread(self.invoke, args, sly_data)
+        """Run invoke directly."""
+        return self.invoke(args, sly_data)
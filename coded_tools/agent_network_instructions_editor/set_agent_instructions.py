@@ -7,7 +7,6 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
-import asyncio
 import logging
 from typing import Any
 
@@ -15,6 +14,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 AGENT_NETWORK_DEFINITION = "agent_network_definition"
 
+LOGGER = logging.getLogger(__name__)
+
 
 class SetAgentInstructions(CodedTool):
     """
@@ -64,23 +65,25 @@ class SetAgentInstructions(CodedTool):
         the_agent_name: str = args.get("agent_name")
         if not the_agent_name:
             return "Error: No agent_name provided."
-        if the_agent_name not in network_def:
+        # Look the agent up once and write through the returned entry below
+        agent: dict[str, Any] = network_def.get(the_agent_name)
+        if agent is None:
             return f"Error: Agent not found: {the_agent_name}"
 
         new_instructions: str = args.get("new_instructions")
         if not new_instructions:
             return "Error: No agent instructions provided."
 
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = LOGGER
         logger.info(">>>>>>>>>>>>>>>>>>>Set Agent Instructions>>>>>>>>>>>>>>>>>>")
         logger.info("Agent Name: %s", the_agent_name)
         logger.info("Instructions: %s", new_instructions)
-        network_def[the_agent_name]["instructions"] = new_instructions
-        logger.info("The resulting agent network: \n %s", str(network_def))
-        sly_data[AGENT_NETWORK_DEFINITION] = network_def
+        # network_def is the dict held in sly data, so updating the entry updates sly data as well
+        agent["instructions"] = new_instructions
+        logger.info("The resulting agent network: \n %s", network_def)
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return network_def
 
     async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> str:
-        """Run invoke asynchronously."""
-        return await asyncio.to_thread(self.invoke, args, sly_data)
+        """Run invoke directly."""
+        return self.invoke(args, sly_data)
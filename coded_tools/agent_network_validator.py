@@ -11,27 +11,111 @@
 # END COPYRIGHT
 
 from typing import Any
+from typing import Iterable
+from typing import Iterator
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """
+    :param mask: A bit mask of agent indices
+    :return: An iterator over the indices of the set bits, lowest first
+    """
+    while mask:
+        lowest: int = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def _normalize_keywords(keywords: str | Iterable[str]) -> tuple[str, ...]:
+    """
+    :param keywords: A keyword, or several keywords
+    :return: The keywords as a tuple, so that a single keyword is not iterated character by character
+    """
+    if isinstance(keywords, str):
+        return (keywords,)
+    return tuple(keywords)
+
+
+def _missing_keyword_error(agent_name: str, keyword: str) -> str:
+    """
+    :param agent_name: Name of the agent missing a keyword
+    :param keyword: The missing keyword
+    :return: The error message for the missing keyword
+    """
+    return f"{agent_name} has no key: {keyword}"
+
+
+def _add_down_chains(agent_name: str, down_chains: list[str], has_down_chains: set[str], as_down_chains: set[str]):
+    """
+    Records the down chains of an agent for finding the top agents,
+    which are the agents in has_down_chains that are not in as_down_chains.
+
+    :param agent_name: Name of the agent
+    :param down_chains: The down chains of the agent
+    :param has_down_chains: Set of the agents that have down chains, updated in place
+    :param as_down_chains: Set of the agents that are down chains of others, updated in place
+    """
+    if down_chains:
+        has_down_chains.add(agent_name)
+        as_down_chains.update(down_chains)
 
 
 class AgentNetworkValidator:
-    """Validator for both structure and instructions of agent network definition."""
+    """
+    Validator for both structure and instructions of agent network definition.
 
-    def __init__(self, network: dict[str, dict[str, Any]]):
-        self.network = network        
+    Results derived from the network, such as its top agents, are computed once and reused,
+    so the network should not be modified once validation has started.
+    """
 
-    def validate_network_keywords(self, keyword: str) -> list[str]:
+    def __init__(self, network: dict[str, dict[str, Any]]):
+        self.network = network
+        # Top agents of the network, found on first use
+        self._top_agents: frozenset[str] | None = None
+        # Agent names, their indices and down chain indices, built on first traversal
+        self._indexed_network: tuple[list[str], dict[str, int], list[tuple[int, ...]]] | None = None
+        # Comma-separated, double-quoted down-chain names of each agent, as used in a HOCON "tools" list.
+        # Filled in by validate_network() so that HOCON generation need not walk the down chains again.
+        self.quoted_down_chains: dict[str, str] = {}
+
+    def validate_network_keywords(self, keywords: str | Iterable[str]) -> list[str]:
         """
         Validation of the agent network keywords. Currently, the only required keyword is "instructions".
 
+        :param keywords: A keyword, or several keywords, that every agent is required to have
         :return: List of agents and missing keywords
         """
-        errors: list[str] = []
-        for agent_name, agent in self.network.items():
-            if not agent.get(keyword):
-                error_msg = f"{agent_name} has no key: {keyword}"
-                errors.append(error_msg)
+        keywords = _normalize_keywords(keywords)
+        return [
+            _missing_keyword_error(agent_name, keyword)
+            for agent_name, agent in self.network.items()
+            for keyword in keywords
+            if not agent.get(keyword)
+        ]
+
+    def validate_network(self, keywords: str | Iterable[str] = ("instructions",)) -> list[str]:
+        """
+        Validation of both the structure and the keywords of the agent network.
+        Top agents and missing keywords are found together in a single pass over the agents.
 
-        return errors
+        :param keywords: A keyword, or several keywords, that every agent is required to have
+        :return: List of any issues found, structural issues first.
+        """
+        keywords = _normalize_keywords(keywords)
+        as_down_chains: set[str] = set()
+        has_down_chains: set[str] = set()
+        keyword_errors: list[str] = []
+
+        for agent_name, agent_config in self.network.items():
+            down_chains: list[str] = agent_config.get("down_chains") or []
+            _add_down_chains(agent_name, down_chains, has_down_chains, as_down_chains)
+            self.quoted_down_chains[agent_name] = ",".join(f'"{down_chain}"' for down_chain in down_chains)
+            for keyword in keywords:
+                if not agent_config.get(keyword):
+                    keyword_errors.append(_missing_keyword_error(agent_name, keyword))
+
+        self._top_agents = frozenset(has_down_chains - as_down_chains)
+        return self._validate_structure(self._top_agents) + keyword_errors
 
     def validate_network_structure(self) -> list[str]:
         """
@@ -39,175 +123,235 @@ class AgentNetworkValidator:
 
         :return: List of any issues found.
         """
-        errors: list[str] = []
+        return self._validate_structure(self._find_all_top_agents())
 
-        # Find top agents
-        top_agents = self._find_all_top_agents()
+    def _validate_structure(self, top_agents: frozenset[str]) -> list[str]:
+        """
+        Validation of the agent network structure given its top agents.
 
-        if len(top_agents) == 0:
-            errors.append("No top agent found in network")
-        elif len(top_agents) > 1:
-            errors.append(f"Multiple top agents found: {sorted(top_agents)}. Expected exactly one.")
+        :param top_agents: Set of top agent names
+        :return: List of any issues found.
+        """
+        errors: list[str] = []
 
-        # Find cyclical agents
-        cyclical_agents = self._find_cyclical_agents()
+        top_agent_error: str | None = self._top_agent_error(top_agents)
+        if top_agent_error:
+            errors.append(top_agent_error)
+
+        # Find cyclical and unreachable agents in a single traversal
+        # (unreachable agents are only meaningful if we have exactly one top agent)
+        top_agent: str | None = next(iter(top_agents)) if len(top_agents) == 1 else None
+        cyclical_agents, unreachable_agents = self._find_cyclical_and_unreachable_agents(top_agent)
         if cyclical_agents:
             errors.append(f"Cyclical dependencies found in agents: {sorted(cyclical_agents)}")
-
-        # Find unreachable agents (only meaningful if we have exactly one top agent)
-        unreachable_agents = set()
-        if len(top_agents) == 1:
-            unreachable_agents = self._find_unreachable_agents(next(iter(top_agents)))
-            if unreachable_agents:
-                errors.append(f"Unreachable agents found: {sorted(unreachable_agents)}")
+        if unreachable_agents:
+            errors.append(f"Unreachable agents found: {sorted(unreachable_agents)}")
 
         return errors
 
-    def _find_all_top_agents(self) -> set[str]:
+    def _find_all_top_agents(self) -> frozenset[str]:
         """
         Find all top agents - agents that have down_chains but are not down_chains of others.
+        The result is computed once per validator.
 
         :return: Set of top agent names
         """
-        as_down_chains = set()
-        has_down_chains = set()
+        if self._top_agents is not None:
+            return self._top_agents
+
+        as_down_chains: set[str] = set()
+        has_down_chains: set[str] = set()
 
         for agent_name, agent_config in self.network.items():
-            down_chains: list[str] = agent_config.get("down_chains", [])
-            if down_chains:
-                has_down_chains.add(agent_name)
-                as_down_chains.update(down_chains)
+            _add_down_chains(agent_name, agent_config.get("down_chains") or [], has_down_chains, as_down_chains)
 
-        return has_down_chains - as_down_chains
+        self._top_agents = frozenset(has_down_chains - as_down_chains)
+        return self._top_agents
 
-    def _find_cyclical_agents(self) -> set[str]:
+    def _index_network(self) -> tuple[list[str], dict[str, int], list[tuple[int, ...]]]:
         """
-        Find agents that are part of cyclical dependencies using DFS.
+        Number the agents of the network so that traversals can track agents as bits of an int
+        instead of hashing agent names on every visit. The result is computed once per validator.
 
-        :return: Set of agent names that are part of cycles
+        :return: A tuple of
+                * the agent names, in network order, so that the index of a name is its bit
+                * the index of each agent name
+                * the indices of each agent's down chains that exist in the network, in down chain order
         """
-        # Step 1: Initialize state tracking for all agents
-        # 0 = unvisited, 1 = currently being processed, 2 = fully processed
-        state: dict[str, int] = {agent: 0 for agent in self.network.keys()}
+        if self._indexed_network is not None:
+            return self._indexed_network
 
-        # Step 2: Set to collect all agents that are part of cycles
-        cyclical_agents: set[str] = set()
+        names: list[str] = list(self.network.keys())
+        index: dict[str, int] = {name: i for i, name in enumerate(names)}
+        children: list[tuple[int, ...]] = [
+            tuple(index[child] for child in self._get_down_chains(name) if child in index) for name in names
+        ]
 
-        # Step 3: Start DFS from each unvisited agent to ensure we check all components
-        # (the network might have disconnected parts)
-        for agent in self.network.keys():
-            if state[agent] == 0:  # Only start DFS from unvisited agents
-                # Start DFS with empty path - this agent is the root of this search
-                self._dfs_cycle_detection(agent, [], state, cyclical_agents)
-
-        # Step 4: Return all agents that were found to be part of cycles
-        return cyclical_agents
-
-    def _dfs_cycle_detection(self, agent: str, path: list[str], state: dict[str, int], cyclical_agents: set[str]):
-        """
-        Perform Depth-First Search (DFS) traversal to detect cycles starting from a specific agent.
+        self._indexed_network = (names, index, children)
+        return self._indexed_network
 
-        :param agent: Current agent being visited
-        :param path: Current path from start to current agent (for cycle identification)
-        :param state: Dictionary tracking visit state of all agents (0=unvisited, 1=processing, 2=completed)
-        :param cyclical_agents: Set to collect all agents that are part of any cycle
+    def _find_cyclical_and_unreachable_agents(self, top_agent: str | None) -> tuple[set[str], set[str]]:
         """
-        # Step 1: Check if we've encountered an agent currently being processed (back edge = cycle)
-        if state[agent] == 1:
-            # Cycle detected! The agent is already in our current processing path
-            cycle_start_idx = path.index(agent)  # Find where the cycle starts in our path
-            cycle_agents = set(path[cycle_start_idx:] + [agent])  # Extract all agents in the cycle
-            cyclical_agents.update(cycle_agents)  # Add them to our result set
-            return
-
-        # Step 2: Skip if this agent was already fully processed in a previous DFS
-        if state[agent] == 2:
-            return  # Already completed, no need to process again
-
-        # Step 3: Mark agent as currently being processed (prevents infinite recursion)
-        state[agent] = 1
-
-        # Step 4: Add current agent to the path (to track the route we took to get here)
-        path.append(agent)
-
-        # Step 5: Get all child agents (down_chains) of current agent
-        down_chains: list[str] = self.network.get(agent, {}).get("down_chains", [])
-
-        # Step 6: Recursively visit each child agent
-        for child_agent in down_chains:
-            # Only visit child if it exists in our network (safety check)
-            if child_agent in self.network:
-                self._dfs_cycle_detection(child_agent, path, state, cyclical_agents)
+        Find agents that are part of cyclical dependencies and agents that are unreachable from the top agent
+        with a single pass of Tarjan's strongly connected components algorithm.
 
-        # Step 7: Backtrack - remove current agent from path as we're done processing it
-        path.pop()
+        An agent is cyclical when its strongly connected component has more than one agent,
+        or when it is its own down chain. The first Depth-First Search (DFS) starts from the top agent,
+        so the agents it visits are exactly the reachable ones.
 
-        # Step 8: Mark agent as fully processed (all its descendants have been explored)
-        state[agent] = 2
-
-    def _find_unreachable_agents(self, top_agent: str) -> set[str]:
+        :param top_agent: The single top agent of the network, or None if there is not exactly one
+        :return: A tuple of the set of cyclical agent names and the set of agent names unreachable
+                from the top agent (empty if there is no single top agent)
         """
-        Find agents that are unreachable from the top agent using Depth-First Search (DFS) traversal.
-
-        :param top_agent: The single top agent to start from
-        :return: Set of unreachable agent names
+        names, index, children = self._index_network()
+        components = _StronglyConnectedComponents(len(names))
+
+        # Step 1: Search from the top agent first, so that everything visited so far is reachable from it
+        reachable: int = 0
+        top_index: int | None = index.get(top_agent) if top_agent is not None else None
+        if top_index is not None:
+            components.search(top_index, children)
+            reachable = components.visited
+
+        # Step 2: Search from every agent not visited yet, since the network might have disconnected parts
+        for root in range(len(names)):
+            components.search(root, children)
+
+        # Step 3: Map the bit masks back to agent names, unreachable agents being all agents but the reachable ones
+        cyclical_agents: set[str] = {names[i] for i in _iter_bits(components.cyclical)}
+        unreachable_agents: set[str] = set()
+        if top_agent is not None:
+            unreachable: int = ((1 << len(names)) - 1) & ~reachable
+            unreachable_agents = {names[i] for i in _iter_bits(unreachable)}
+        return cyclical_agents, unreachable_agents
+
+    def _get_down_chains(self, agent: str) -> list[str]:
         """
-        # Step 1: Initialize set to track all agents we can reach from top agent
-        reachable_agents: set[str] = set()
-
-        # Step 2: Initialize visited set to track DFS traversal (prevents infinite loops in cycles)
-        visited: set[str] = set()
+        :param agent: Name of an agent in the network
+        :return: The down chains (child agents) of the agent
+        """
+        return self.network.get(agent, {}).get("down_chains") or []
 
-        # Step 3: Start DFS traversal from the top agent to find all reachable agents
-        self._dfs_reachability_traversal(top_agent, visited, reachable_agents)
+    def get_top_agent(self) -> str:
+        """
+        Get the single top agent from a valid network.
 
-        # Step 4: Get complete set of all agents in the network
-        all_agents: set[str] = set(self.network.keys())
+        :return: Name of the top agent
+        :raises ValueError: If network doesn't have exactly one top agent
+        """
+        return self._get_top_agent(self._find_all_top_agents())
 
-        # Step 5: Calculate unreachable agents by subtracting reachable from all agents
-        unreachable_agents: set[str] = all_agents - reachable_agents
+    @staticmethod
+    def _get_top_agent(top_agents: frozenset[str]) -> str:
+        """
+        :param top_agents: Set of top agent names
+        :return: Name of the single top agent
+        :raises ValueError: If there is not exactly one top agent
+        """
+        top_agent_error: str | None = AgentNetworkValidator._top_agent_error(top_agents)
+        if top_agent_error:
+            raise ValueError(top_agent_error)
 
-        # Step 6: Return the set of agents that cannot be reached from top agent
-        return unreachable_agents
+        return next(iter(top_agents))
 
-    def _dfs_reachability_traversal(self, agent: str, visited: set[str], reachable_agents: set[str]):
+    @staticmethod
+    def _top_agent_error(top_agents: frozenset[str]) -> str | None:
         """
-        Perform DFS traversal to find all agents reachable from a specific starting agent.
+        The error message is only assembled when there is an error,
+        so a valid network never pays for sorting its top agents.
 
-        :param agent: Current agent being visited
-        :param visited: Set of agents already visited in this traversal (prevents infinite loops)
-        :param reachable_agents: Set to collect all agents that can be reached
+        :param top_agents: Set of top agent names
+        :return: The error message if there is not exactly one top agent, otherwise None
         """
-        # Step 1: Check if we've already visited this agent or if it doesn't exist in network
-        if agent in visited or agent not in self.network:
-            return  # Skip already visited agents or non-existent agents
-
-        # Step 2: Mark current agent as visited to prevent revisiting
-        visited.add(agent)
+        if len(top_agents) == 1:
+            return None
+        if not top_agents:
+            return "No top agent found in network"
+        return f"Multiple top agents found: {sorted(top_agents)}. Expected exactly one."
 
-        # Step 3: Add current agent to our reachable set
-        reachable_agents.add(agent)
 
-        # Step 4: Get all child agents (down_chains) of current agent
-        down_chains: list[str] = self.network.get(agent, {}).get("down_chains", [])
+class _StronglyConnectedComponents:
+    """
+    Iterative Tarjan's strongly connected components algorithm over agent indices.
+    An explicit stack is used instead of recursion, so deep chains cannot hit the recursion limit.
+    Sets of agents are kept as bit masks, with bit i standing for agent i.
+    """
 
-        # Step 5: Recursively visit each child agent to continue the traversal
-        for child_agent in down_chains:
-            # Visit each child - the recursion will handle visited check and network existence
-            self._dfs_reachability_traversal(child_agent, visited, reachable_agents)
+    # pylint: disable=too-few-public-methods
+    def __init__(self, count: int):
+        """
+        :param count: Number of agents in the network
+        """
+        # order[i] is the DFS visiting order of agent i, and low_link[i] is the lowest
+        # visiting order reachable from agent i through the DFS tree and at most one back edge.
+        self.order: list[int] = [0] * count
+        self.low_link: list[int] = [0] * count
+        self.visit_count: int = 0
+        # Agents visited so far, and agents that are part of cycles
+        self.visited: int = 0
+        self.cyclical: int = 0
+        # Agents of components still being built, as a stack and as a bit mask for membership
+        self.component_stack: list[int] = []
+        self.on_stack: int = 0
+
+    def search(self, root: int, children: list[tuple[int, ...]]):
+        """
+        Depth-First Search (DFS) from an agent, unless it was already visited.
 
-    def get_top_agent(self) -> str:
+        :param root: Index of the agent to start from
+        :param children: The indices of each agent's down chains.
+                Children that do not exist in the network were left out when indexing, so they are never visited.
         """
-        Get the single top agent from a valid network.
+        if self.visited >> root & 1:
+            return
 
-        :return: Name of the top agent
-        :raises ValueError: If network doesn't have exactly one top agent
+        # Each stack entry is an agent being processed and an iterator over its remaining children
+        self._visit(root)
+        stack: list[tuple[int, Iterator[int]]] = [(root, iter(children[root]))]
+
+        while stack:
+            agent, child_iterator = stack[-1]
+            child: int = next(child_iterator, -1)
+
+            if child < 0:
+                # All children explored - backtrack, passing the low link up to the parent
+                stack.pop()
+                if stack:
+                    parent: int = stack[-1][0]
+                    self.low_link[parent] = min(self.low_link[parent], self.low_link[agent])
+                if self.low_link[agent] == self.order[agent]:
+                    self._pop_component(agent)
+            elif not self.visited >> child & 1:
+                # Descend into an unvisited child
+                self._visit(child)
+                stack.append((child, iter(children[child])))
+            elif self.on_stack >> child & 1:
+                # Edge back to an agent of a component still being built
+                self.low_link[agent] = min(self.low_link[agent], self.order[child])
+                if child == agent:
+                    self.cyclical |= 1 << agent
+
+    def _visit(self, agent: int):
+        """
+        :param agent: Index of the agent being visited for the first time
         """
-        top_agents = self._find_all_top_agents()
+        self.order[agent] = self.low_link[agent] = self.visit_count
+        self.visit_count += 1
+        self.visited |= 1 << agent
+        self.component_stack.append(agent)
+        self.on_stack |= 1 << agent
 
-        if len(top_agents) == 0:
-            raise ValueError("No top agent found in network")
-        if len(top_agents) > 1:
-            raise ValueError(f"Multiple top agents found: {sorted(top_agents)}. Expected exactly one.")
+    def _pop_component(self, root: int):
+        """
+        Pops the agents of a finished component, which are the ones above its root on the component stack.
 
-        return next(iter(top_agents))
+        :param root: Index of the agent that cannot reach further back, the root of the component
+        """
+        component: int = 0
+        member: int = -1
+        while member != root:
+            member = self.component_stack.pop()
+            component |= 1 << member
+        self.on_stack &= ~component
+        if component & (component - 1):  # More than one agent in the component
+            self.cyclical |= component
@@ -7,6 +7,8 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
+import asyncio
+import logging
 import os
 from typing import Any
 from typing import Dict
@@ -15,6 +17,8 @@ from typing import Union
 from neuro_san.interfaces.coded_tool import CodedTool
 from pypdf import PdfReader
 
+LOGGER = logging.getLogger(__name__)
+
 
 class ExtractDocs(CodedTool):
     """
@@ -22,20 +26,19 @@ class ExtractDocs(CodedTool):
     Returns a dictionary mapping each PDF file name to its extracted text.
     """
 
-    def __init__(self):
-        self.default_path = ["coded_tools/airline_policy/knowdocs/Help Center.txt"]
-
-        self.docs_path = {
-            "Bag Issues": "coded_tools/airline_policy/knowdocs/baggage/bag-issues",
-            "Carry On Baggage": "coded_tools/airline_policy/knowdocs/baggage/carryon",
-            "Checked Baggage": "coded_tools/airline_policy/knowdocs/baggage/checked",
-            "Special Items": "coded_tools/airline_policy/knowdocs/baggage/special-items",
-            "Military Personnel": "coded_tools/airline_policy/knowdocs/flight/military-personnel",
-            "Mileage Plus": "coded_tools/airline_policy/knowdocs/flight/mileage-plus",
-            "Basic Economy Restrictions": "coded_tools/airline_policy/knowdocs/flight/basic-econ",
-            "International Checked Baggage": "coded_tools/airline_policy/knowdocs/international",
-            "Embargoes": "coded_tools/airline_policy/knowdocs/international",
-        }
+    default_path = ["coded_tools/airline_policy/knowdocs/Help Center.txt"]
+
+    docs_path = {
+        "Bag Issues": "coded_tools/airline_policy/knowdocs/baggage/bag-issues",
+        "Carry On Baggage": "coded_tools/airline_policy/knowdocs/baggage/carryon",
+        "Checked Baggage": "coded_tools/airline_policy/knowdocs/baggage/checked",
+        "Special Items": "coded_tools/airline_policy/knowdocs/baggage/special-items",
+        "Military Personnel": "coded_tools/airline_policy/knowdocs/flight/military-personnel",
+        "Mileage Plus": "coded_tools/airline_policy/knowdocs/flight/mileage-plus",
+        "Basic Economy Restrictions": "coded_tools/airline_policy/knowdocs/flight/basic-econ",
+        "International Checked Baggage": "coded_tools/airline_policy/knowdocs/international",
+        "Embargoes": "coded_tools/airline_policy/knowdocs/international",
+    }
 
     def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[Dict[str, Any], str]:
         """
@@ -65,8 +68,8 @@ class ExtractDocs(CodedTool):
                 "Error: <error message>"
         """
         app_name: str = args.get("app_name", None)
-        print("############### PDF text reader ###############")
-        print(f"App name: {app_name}")
+        LOGGER.info("############### PDF text reader ###############")
+        LOGGER.info("App name: %s", app_name)
         if app_name is None:
             return "Error: No app name provided."
         directory = self.docs_path.get(app_name, self.default_path)
@@ -92,12 +95,16 @@ class ExtractDocs(CodedTool):
                     # Store in the dictionary using a relative path
                     rel_path = os.path.relpath(file_path, directory)
                     docs[rel_path] = content
-        print("############### Documents extraction done ###############")
+        LOGGER.info("############### Documents extraction done ###############")
         if not docs:
-            print("No PDF or text files found in the directory.")
+            LOGGER.info("No PDF or text files found in the directory.")
             return {"docs": {}}
         return {"files": docs}
 
+    async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[Dict[str, Any], str]:
+        """Run invoke asynchronously."""
+        return await asyncio.to_thread(self.invoke, args, sly_data)
+
     def extract_pdf_content(self, pdf_path: str) -> str:
         """
         Extract text from a PDF file using pypdf, while attempting to preserve
@@ -117,7 +124,7 @@ class ExtractDocs(CodedTool):
                 text_output.append(page_text)
         except Exception as e:
             # In case there's an issue with reading the PDF
-            print(f"Error reading PDF {pdf_path}: {e}")
+            LOGGER.error("Error reading PDF %s: %s", pdf_path, e)
             return ""
 
         return "".join(text_output)
@@ -134,5 +141,5 @@ class ExtractDocs(CodedTool):
                 return f.read()
         except Exception as e:
             # In case there's an issue with reading the text file
-            print(f"Error reading TXT {txt_path}: {e}")
+            LOGGER.error("Error reading TXT %s: %s", txt_path, e)
             return ""
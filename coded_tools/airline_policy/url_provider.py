@@ -7,39 +7,38 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
+import logging
 from typing import Any
 from typing import Dict
 from typing import Union
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
+LOGGER = logging.getLogger(__name__)
+
 
 class URLProvider(CodedTool):
     """
     CodedTool implementation which provides URLs for airline's helpdesk and intranet resources.
     """
 
-    def __init__(self):
-        """
-        Constructs a URL Provider for airline's intranet.
-        """
-        self.airline_policy_urls = {
-            "Baggage Tracking": "https://www.united.com/en/us/bagdelivery/start",
-            "Damaged Bags Claim": "https://rynnsluggage.com/",
-            "Missing Items": "https://www.united.com/en/US/fly/help/lost-and-found.html",
-            "Claims Status": "https://www.united.com/en/us/claimform/checkstatus",
-            "Carry On Baggage": "https://www.united.com/en/us/fly/baggage/carry-on-bags.html",
-            "Checked Baggage": "https://www.united.com/en/us/fly/baggage/checked-bags.html",
-            "Bag Issues": "https://www.united.com/en/us/baggage/bag-help",
-            "Special Items": "https://www.tsa.gov/travel/security-screening/whatcanibring/sporting-and-camping",
-            "Military_Personnel": "https://www.united.com/en/us/fly/company/company-info/military-benefits-and-discounts.html",  # noqa E501
-            "Mileage Plus": "https://www.united.com/en/us/fly/mileageplus.html",
-            "International Checked Baggage": "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html",  # noqa E501
-            "International Travel Requirements": "https://www.united.com/en/us/travel/trip-planning/travel-requirements",  # noqa E501
-            "Embargoes": "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html",
-            "Basic Economy_Restrictions": "https://www.united.com/en/us/fly/travel/inflight/basic-economy.html",
-            "Bag Fee Calculator": "https://www.united.com/en/us/checked-bag-fee-calculator/any-flights",
-        }
+    airline_policy_urls = {
+        "Baggage Tracking": "https://www.united.com/en/us/bagdelivery/start",
+        "Damaged Bags Claim": "https://rynnsluggage.com/",
+        "Missing Items": "https://www.united.com/en/US/fly/help/lost-and-found.html",
+        "Claims Status": "https://www.united.com/en/us/claimform/checkstatus",
+        "Carry On Baggage": "https://www.united.com/en/us/fly/baggage/carry-on-bags.html",
+        "Checked Baggage": "https://www.united.com/en/us/fly/baggage/checked-bags.html",
+        "Bag Issues": "https://www.united.com/en/us/baggage/bag-help",
+        "Special Items": "https://www.tsa.gov/travel/security-screening/whatcanibring/sporting-and-camping",
+        "Military_Personnel": "https://www.united.com/en/us/fly/company/company-info/military-benefits-and-discounts.html",  # noqa E501
+        "Mileage Plus": "https://www.united.com/en/us/fly/mileageplus.html",
+        "International Checked Baggage": "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html",  # noqa E501
+        "International Travel Requirements": "https://www.united.com/en/us/travel/trip-planning/travel-requirements",  # noqa E501
+        "Embargoes": "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html",
+        "Basic Economy_Restrictions": "https://www.united.com/en/us/fly/travel/inflight/basic-economy.html",
+        "Bag Fee Calculator": "https://www.united.com/en/us/checked-bag-fee-calculator/any-flights",
+    }
 
     def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[Dict[str, Any], str]:
         """
@@ -73,9 +72,10 @@ class URLProvider(CodedTool):
         app_name: str = args.get("app_name", None)
         if app_name is None:
             return "Error: No app name provided."
-        print(">>>>>>>>>>>>>>>>>>>URL Provider>>>>>>>>>>>>>>>>>>")
-        print(f"App name: {app_name}")
+        logger = LOGGER
+        logger.info(">>>>>>>>>>>>>>>>>>>URL Provider>>>>>>>>>>>>>>>>>>")
+        logger.info("App name: %s", app_name)
         app_url = self.airline_policy_urls.get(app_name)
-        print(f"URL: {app_url}")
-        print(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
+        logger.info("URL: %s", app_url)
+        logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return app_url
@@ -7,6 +7,9 @@
 # Purchase of a commercial license is mandatory for any use of the
 # neuro-san-studio SDK Software in commercial settings.
 #
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Dict
 from typing import Union
@@ -14,6 +17,42 @@ from typing import Union
 import requests
 from bs4 import BeautifulSoup
 from neuro_san.interfaces.coded_tool import CodedTool
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"  # noqa E501
+}
+
+# Shared by all invocations so that connections to the same hosts are kept alive and reused
+# instead of paying a new TCP and TLS handshake for every page.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
+# Transient failures (rate limiting and server errors) are retried twice, immediately and then after 1s,
+# before a page is reported as an error. Retry-After is ignored, since a server asking for minutes
+# would otherwise hold the whole tool call for that long.
+RETRY = Retry(
+    total=2,
+    backoff_factor=0.5,
+    respect_retry_after_header=False,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+SESSION.mount("https://", HTTPAdapter(max_retries=RETRY))
+SESSION.mount("http://", HTTPAdapter(max_retries=RETRY))
+
+# Seconds to wait for a connection, and then between bytes of the page, so an unreachable host fails fast.
+# With the retries above, a URL that never answers is given up on after at most
+# 3 attempts * (2s + 4s) + 1s backoff = 19s. The pages of a request are fetched in parallel,
+# so this is also the worst case for the whole tool call.
+REQUEST_TIMEOUT = (2.0, 4.0)
+
+# Upper bound on the number of pages fetched at the same time for one request
+MAX_FETCH_WORKERS = 8
+
+LOGGER = logging.getLogger(__name__)
 
 
 class WebPageReader(CodedTool):
@@ -21,35 +60,31 @@ class WebPageReader(CodedTool):
     A coded tool that reads and extracts all visible text from a given webpage URL.
     """
 
-    def __init__(self):
-        """
-        Constructs a WebPageReader for airline's intranet.
-        """
-        self.default_url = ["https://www.united.com/en/us/fly/help-center.html"]
-        self.airline_policy_urls = {
-            "Carry On Baggage": ["https://www.united.com/en/us/fly/baggage/carry-on-bags.html"],
-            "Checked Baggage": ["https://www.united.com/en/us/fly/baggage/checked-bags.html"],
-            "Bag Issues": [
-                "https://www.united.com/en/us/baggage/bag-help",
-                "https://www.united.com/en/US/fly/help/lost-and-found.html",
-            ],
-            "Special Items": [
-                "https://www.tsa.gov/travel/security-screening/whatcanibring/sporting-and-camping",
-                "https://www.united.com/en/us/fly/baggage/fragile-and-valuable-items.html",
-            ],
-            "Military Personnel": [
-                "https://www.united.com/en/us/fly/company/company-info/military-benefits-and-discounts.html"
-            ],
-            "Basic Economy Restrictions": ["https://www.united.com/en/us/fly/travel/inflight/basic-economy.html"],
-            "Mileage Plus": ["https://www.united.com/en/us/fly/mileageplus.html"],
-            "Bag Fee Calculator": ["https://www.united.com/en/us/checked-bag-fee-calculator/any-flights"],
-            "International Checked_Baggage": [
-                "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html"
-            ],
-            "Embargoes": ["https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html"],
-        }
-
-    def invoke(self, args: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+    default_url = ["https://www.united.com/en/us/fly/help-center.html"]
+    airline_policy_urls = {
+        "Carry On Baggage": ["https://www.united.com/en/us/fly/baggage/carry-on-bags.html"],
+        "Checked Baggage": ["https://www.united.com/en/us/fly/baggage/checked-bags.html"],
+        "Bag Issues": [
+            "https://www.united.com/en/us/baggage/bag-help",
+            "https://www.united.com/en/US/fly/help/lost-and-found.html",
+        ],
+        "Special Items": [
+            "https://www.tsa.gov/travel/security-screening/whatcanibring/sporting-and-camping",
+            "https://www.united.com/en/us/fly/baggage/fragile-and-valuable-items.html",
+        ],
+        "Military Personnel": [
+            "https://www.united.com/en/us/fly/company/company-info/military-benefits-and-discounts.html"
+        ],
+        "Basic Economy Restrictions": ["https://www.united.com/en/us/fly/travel/inflight/basic-economy.html"],
+        "Mileage Plus": ["https://www.united.com/en/us/fly/mileageplus.html"],
+        "Bag Fee Calculator": ["https://www.united.com/en/us/checked-bag-fee-calculator/any-flights"],
+        "International Checked_Baggage": [
+            "https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html"
+        ],
+        "Embargoes": ["https://www.united.com/en/us/fly/baggage/international-checked-bag-limits.html"],
+    }
+
+    def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
         """
         :param args: An argument dictionary whose keys are the parameters
                 to the coded tool and whose values are the values passed for them
@@ -81,29 +116,40 @@ class WebPageReader(CodedTool):
         app_name: str = args.get("app_name", None)
         if app_name is None:
             return "Error: No app name provided."
-        print(">>>>>>>>>>>>>>>>>>> Extracting text >>>>>>>>>>>>>>>>>>")
+        logger = LOGGER
+        logger.info(">>>>>>>>>>>>>>>>>>> Extracting text >>>>>>>>>>>>>>>>>>")
         try:
             urls = self.airline_policy_urls.get(app_name, self.default_url)
-            print(f"Fetching details from: {urls}")
+            logger.info("Fetching details from: %s", urls)
             if not isinstance(urls, list) or not urls:
                 return "Error: No URLs provided or invalid format. Expected a list of URLs."
 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"  # noqa E501
-            }
-            results = {}
-            for url in urls:
-                try:
-                    response = requests.get(url, headers=headers)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    texts = soup.stripped_strings
-                    full_text = " ".join(texts)
-                    results[url] = full_text
-                except Exception as e:
-                    results[url] = f"Error: Unable to process the URL. {str(e)}"
-            print(">>>>>>>>>>>>>>>>>>> Done! >>>>>>>>>>>>>>>>>>")
+            # Fetch the pages concurrently so the wall-clock time follows the slowest page
+            # rather than the sum of all of them. map() keeps the results in URL order.
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(urls))) as executor:
+                results = dict(zip(urls, executor.map(self.read_page, urls)))
+            logger.info(">>>>>>>>>>>>>>>>>>> Done! >>>>>>>>>>>>>>>>>>")
             return results
         except Exception as e:
             return f"Error: Unable to process the request. {str(e)}"
+
+    async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        """Run invoke asynchronously."""
+        return await asyncio.to_thread(self.invoke, args, sly_data)
+
+    @staticmethod
+    def read_page(url: str) -> str:
+        """
+        :param url: The URL of the webpage to read
+        :return: The visible text of the webpage, or an error message in the format:
+                "Error: <error message>"
+        """
+        try:
+            response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+
+            soup = BeautifulSoup(response.text, "html.parser")
+            texts = soup.stripped_strings
+            return " ".join(texts)
+        except Exception as e:
+            return f"Error: Unable to process the URL. {str(e)}"
@@ -18,6 +18,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 AGENT_NETWORK_DEFINITION = "agent_network_definition"
 AGENT_NETWORK_HOCON_FILE = "agent_network_hocon_file"
 
+LOGGER = logging.getLogger(__name__)
+
 
 class GetAgentNetworkDefinition(CodedTool):
     """
@@ -58,7 +60,7 @@ class GetAgentNetworkDefinition(CodedTool):
                 a text string of an error message in the format:
                 "Error: <error message>"
         """
-        logger = logging.getLogger(self.__class__.__name__)
+        logger = LOGGER
 
         # Priority order: user_network_def > network_hocon_file > sly_data > user_hocon_sly_data
         network_def = None
@@ -90,7 +92,7 @@ class GetAgentNetworkDefinition(CodedTool):
         # Store in sly_data and validate
         if network_def:
             sly_data[AGENT_NETWORK_DEFINITION] = network_def
-            logger.info("The resulting agent network definition: \n %s", str(network_def))
+            logger.info("The resulting agent network definition: \n %s", network_def)
             logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
             return network_def
 
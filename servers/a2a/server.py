@@ -5,7 +5,8 @@ See https://github.com/google/a2a-python/tree/main/examples
 and https://google.github.io/A2A/specification
 
 Before running this server
- - `pip install a2a-sdk crewai`
+ - `pip install a2a-sdk crewai "uvicorn[standard]"`
+   (uvicorn uses the uvloop event loop and the httptools HTTP parser from the standard extras when installed)
  - run server by `python server.py`
 """
 
@@ -34,9 +35,35 @@ from a2a.types import AgentSkill
 from agent_executor import CrewAiAgentExecutor
 
 
+DEFAULT_HOST = "localhost"
+DEFAULT_PORT = 9999
+
+# Agent Skill describes a specific capability, function, or area of expertise the agent
+SKILL = AgentSkill(
+    id="Research_Report",
+    name="Research_Report",
+    description="Return bullet points on a given topic",
+    tags=["research", "report"],
+    examples=["ai"],
+)
+
+# Agent Card is a JSON document that describes the server's identity, capabilities, skills,
+# and service endpoint URL. It is built once at import; main() only fills in the URL it serves on.
+AGENT_CARD = AgentCard(
+    name="CrewAI Research Report Agent",
+    description="Agent that does research and returns report on a given topic",
+    url=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}/",
+    version='1.0.0',
+    defaultInputModes=['text'],
+    defaultOutputModes=['text'],
+    capabilities=AgentCapabilities(),
+    skills=[SKILL],
+)
+
+
 @click.command()
-@click.option("--host", "host", default="localhost")
-@click.option("--port", "port", default=9999)
+@click.option("--host", "host", default=DEFAULT_HOST)
+@click.option("--port", "port", default=DEFAULT_PORT)
 def main(host: str, port: int):
     """
     Starts the A2A server with the specified host and port.
@@ -44,33 +71,13 @@ def main(host: str, port: int):
     :param host: The hostname or IP address where the server will run.
     :param port: The port number on which the server will listen.
     """
-
-    # Agent Skill describes a specific capability, function, or area of expertise the agent
-    skill = AgentSkill(
-        id="Research_Report",
-        name="Research_Report",
-        description="Return bullet points on a given topic",
-        tags=["research", "report"],
-        examples=["ai"],
-    )
-
-    # Agent Card is a JSON document that describes the server's identity, capabilities, skills,
-    # and service endpoint URL
-    agent_card = AgentCard(
-        name="CrewAI Research Report Agent",
-        description="Agent that does research and returns report on a given topic",
-        url=f"http://{host}:{port}/",
-        version='1.0.0',
-        defaultInputModes=['text'],
-        defaultOutputModes=['text'],
-        capabilities=AgentCapabilities(),
-        skills=[skill],
-    )
+    agent_card = AGENT_CARD.model_copy(update={"url": f"http://{host}:{port}/"})
 
     request_handler = DefaultRequestHandler(agent_executor=CrewAiAgentExecutor(), task_store=InMemoryTaskStore())
 
     server = A2AStarletteApplication(agent_card=agent_card, http_handler=request_handler)
-    uvicorn.run(server.build(), host=host, port=port)
+    # Access logging is off so that a log line is not written synchronously for every request
+    uvicorn.run(server.build(), host=host, port=port, access_log=False)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,92 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san-studio SDK Software in commercial settings.
+#
+# END COPYRIGHT
+
+from unittest import IsolatedAsyncioTestCase
+
+from coded_tools.agent_network_editor.add_agent import AGENT_NETWORK_DEFINITION
+from coded_tools.agent_network_editor.add_agent import AddAgent
+from coded_tools.agent_network_editor.add_agent import AddAgents
+
+
+class TestAddAgents(IsolatedAsyncioTestCase):
+    """
+    Unit tests for the AddAgent and AddAgents coded tools.
+    """
+
+    def test_add_agents_to_existing_network(self):
+        """
+        All the agents are added with empty definitions, and existing agents are kept.
+        """
+        sly_data = {AGENT_NETWORK_DEFINITION: {"top": {"instructions": "x", "down_chains": ["first"]}}}
+        result = AddAgents().invoke({"agent_names": ["first", "second"]}, sly_data)
+
+        expected = {"top": {"instructions": "x", "down_chains": ["first"]}, "first": {}, "second": {}}
+        self.assertEqual(result, expected)
+        self.assertEqual(sly_data[AGENT_NETWORK_DEFINITION], expected)
+
+    def test_existing_agents_are_kept(self):
+        """
+        An agent of the batch that is already in the network keeps its definition.
+        """
+        sly_data = {AGENT_NETWORK_DEFINITION: {"a": {"instructions": "x", "down_chains": ["c"]}, "c": {}}}
+        result = AddAgents().invoke({"agent_names": ["a", "b"]}, sly_data)
+
+        self.assertEqual(result, {"a": {"instructions": "x", "down_chains": ["c"]}, "c": {}, "b": {}})
+
+    def test_add_agents_to_empty_sly_data(self):
+        """
+        A new agent network definition is created in the sly data when there is none.
+        """
+        sly_data = {}
+        result = AddAgents().invoke({"agent_names": ["first"]}, sly_data)
+
+        self.assertEqual(result, {"first": {}})
+        self.assertIs(sly_data[AGENT_NETWORK_DEFINITION], result)
+
+    def test_no_agent_names(self):
+        """
+        Missing or empty agent names are an error and leave the sly data untouched.
+        """
+        sly_data = {}
+        self.assertEqual(AddAgents().invoke({}, sly_data), "Error: No agent_names provided.")
+        self.assertEqual(AddAgents().invoke({"agent_names": []}, sly_data), "Error: No agent_names provided.")
+        self.assertEqual(sly_data, {})
+
+    def test_agent_names_not_a_list_of_names(self):
+        """
+        agent_names must be a list of non-empty strings; a string is not split into agents.
+        """
+        expected = "Error: agent_names must be a list of non-empty agent names."
+        sly_data = {}
+        self.assertEqual(AddAgents().invoke({"agent_names": "xyz"}, sly_data), expected)
+        self.assertEqual(AddAgents().invoke({"agent_names": ["a", ""]}, sly_data), expected)
+        self.assertEqual(AddAgents().invoke({"agent_names": ["a", 1]}, sly_data), expected)
+        self.assertEqual(sly_data, {})
+
+    async def test_async_invoke(self):
+        """
+        async_invoke gives the same result as invoke.
+        """
+        sly_data = {}
+        result = await AddAgents().async_invoke({"agent_names": ["first", "second"]}, sly_data)
+        self.assertEqual(result, {"first": {}, "second": {}})
+
+    def test_add_single_agent(self):
+        """
+        AddAgent adds one agent through the same helper.
+        """
+        sly_data = {AGENT_NETWORK_DEFINITION: {"top": {}}}
+        self.assertEqual(AddAgent().invoke({"agent_name": "child"}, sly_data), {"top": {}, "child": {}})
+
+        # Adding an agent that already exists resets its definition, as it always has
+        sly_data[AGENT_NETWORK_DEFINITION]["child"] = {"instructions": "x"}
+        self.assertEqual(AddAgent().invoke({"agent_name": "child"}, sly_data), {"top": {}, "child": {}})
+        self.assertEqual(AddAgent().invoke({}, sly_data), "Error: No agent_name provided.")
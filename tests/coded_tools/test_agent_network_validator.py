@@ -0,0 +1,164 @@
+# Copyright (C) 2023-2025 Cognizant Digital Business, Evolutionary AI.
+# All Rights Reserved.
+# Issued under the Academic Public License.
+#
+# You can be released from the terms, and requirements of the Academic Public
+# License by purchasing a commercial license.
+# Purchase of a commercial license is mandatory for any use of the
+# neuro-san-studio SDK Software in commercial settings.
+#
+# END COPYRIGHT
+
+from unittest import TestCase
+
+from coded_tools.agent_network_validator import AgentNetworkValidator
+
+
+class TestAgentNetworkValidator(TestCase):
+    """
+    Unit tests for the AgentNetworkValidator.
+    """
+
+    def test_valid_network(self):
+        """
+        A tree with a single top agent has no structural issues.
+        """
+        network = {
+            "top": {"instructions": "x", "down_chains": ["left", "right"]},
+            "left": {"instructions": "x", "down_chains": ["leaf"]},
+            "right": {"instructions": "x"},
+            "leaf": {"instructions": "x"},
+        }
+        validator = AgentNetworkValidator(network)
+        self.assertEqual(validator.validate_network_structure(), [])
+        self.assertEqual(validator.get_top_agent(), "top")
+
+    def test_cycle_closed_through_finished_agent(self):
+        """
+        With a -> b -> a and a -> c -> b, agent c is on the cycle a -> c -> b -> a and must be reported,
+        even though b is already fully explored when c reaches it.
+        """
+        network = {
+            "top": {"instructions": "x", "down_chains": ["a"]},
+            "a": {"instructions": "x", "down_chains": ["b", "c"]},
+            "b": {"instructions": "x", "down_chains": ["a"]},
+            "c": {"instructions": "x", "down_chains": ["b"]},
+        }
+        validator = AgentNetworkValidator(network)
+        self.assertEqual(
+            validator.validate_network_structure(),
+            ["Cyclical dependencies found in agents: ['a', 'b', 'c']"],
+        )
+
+    def test_self_down_chain(self):
+        """
+        An agent that is its own down chain is cyclical.
+        """
+        network = {
+            "top": {"instructions": "x", "down_chains": ["loop"]},
+            "loop": {"instructions": "x", "down_chains": ["loop"]},
+        }
+        validator = AgentNetworkValidator(network)
+        self.assertEqual(
+            validator.validate_network_structure(),
+            ["Cyclical dependencies found in agents: ['loop']"],
+        )
+
+    def test_unreachable_agents(self):
+        """
+        Agents that the single top agent cannot reach are reported, and missing down chains are ignored.
+        """
+        network = {
+            "top": {"instructions": "x", "down_chains": ["child", "missing"]},
+            "child": {"instructions": "x"},
+            "orphan": {"instructions": "x"},
+            "other_orphan": {"instructions": "x"},
+        }
+        validator = AgentNetworkValidator(network)
+        self.assertEqual(
+            validator.validate_network_structure(),
+            ["Unreachable agents found: ['orphan', 'other_orphan']"],
+        )
+
+    def test_no_top_agent(self):
+        """
+        A network where every agent with down chains is itself a down chain has no top agent.
+        """
+        network = {
+            "a": {"instructions": "x", "down_chains": ["b"]},
+            "b": {"instructions": "x", "down_chains": ["a"]},
+        }
+        validator = AgentNetworkValidator(network)
+        self.assertEqual(
+            validator.validate_network_structure(),
+            ["No top agent found in network", "Cyclical dependencies found in agents: ['a', 'b']"],
+        )
+        with self.assertRaises(ValueError) as context:
+            validator.get_top_agent()
+        self.assertEqual(str(context.exception), "No top agent found in network")
+
+    def test_multiple_top_agents(self):
+        """
+        Several top agents are reported, and unreachable agents are not checked.
+        """
+        network = {
+            "first": {"instructions": "x", "down_chains": ["shared"]},
+            "second": {"instructions": "x", "down_chains": ["shared"]},
+            "shared": {"instructions": "x"},
+            "orphan": {"instructions": "x"},
+        }
+        validator = AgentNetworkValidator(network)
+        expected = "Multiple top agents found: ['first', 'second']. Expected exactly one."
+        self.assertEqual(validator.validate_network_structure(), [expected])
+        with self.assertRaises(ValueError) as context:
+            validator.get_top_agent()
+        self.assertEqual(str(context.exception), expected)
+
+    def test_deep_chain(self):
+        """
+        A chain of several thousand agents is validated without hitting the recursion limit.
+        """
+        depth = 5000
+        network = {f"agent_{i}": {"instructions": "x", "down_chains": [f"agent_{i + 1}"]} for i in range(depth)}
+        network[f"agent_{depth}"] = {"instructions": "x"}
+        validator = AgentNetworkValidator(network)
+        self.assertEqual(validator.validate_network_structure(), [])
+
+        # Closing the chain into a loop makes every agent cyclical
+        network[f"agent_{depth}"]["down_chains"] = ["agent_1"]
+        validator = AgentNetworkValidator(network)
+        self.assertEqual(
+            validator.validate_network_structure(),
+            [f"Cyclical dependencies found in agents: {sorted(f'agent_{i}' for i in range(1, depth + 1))}"],
+        )
+
+    def test_validate_network(self):
+        """
+        validate_network() reports structural issues first, then missing keywords,
+        and records the quoted down chains of every agent.
+        """
+        network = {
+            "top": {"instructions": "x", "down_chains": ["child", "other"]},
+            "child": {"instructions": "x", "down_chains": ["top"]},
+            "other": {},
+            "orphan": {"instructions": ""},
+        }
+        validator = AgentNetworkValidator(network)
+        self.assertEqual(
+            validator.validate_network(("instructions",)),
+            [
+                "No top agent found in network",
+                "Cyclical dependencies found in agents: ['child', 'top']",
+                "other has no key: instructions",
+                "orphan has no key: instructions",
+            ],
+        )
+        self.assertEqual(
+            validator.validate_network(("instructions",)),
+            validator.validate_network_structure() + validator.validate_network_keywords("instructions"),
+        )
+        self.assertEqual(validator.validate_network("instructions"), validator.validate_network(("instructions",)))
+        self.assertEqual(
+            validator.quoted_down_chains,
+            {"top": '"child","other"', "child": '"top"', "other": "", "orphan": ""},
+        )